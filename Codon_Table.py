@@ -10,11 +10,12 @@ Date: 2025
 Project: LCOM.e
 """
 
-from typing import Dict, List, Set
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping, Tuple
 
 # Standard RNA Codon Table - Maps RNA triplets to amino acids
 # Based on the universal genetic code used in most organisms
-RNA_CODON_TABLE: Dict[str, str] = {
+_RNA_CODON_TABLE: Dict[str, str] = {
     # Phenylalanine (Phe, F)
     "UUU": "Phe", "UUC": "Phe",
     
@@ -92,12 +93,40 @@ RNA_CODON_TABLE: Dict[str, str] = {
     "UGA": "STOP",  # Opal stop codon
 }
 
+# Read-only view over the table; the source name is dropped so the proxy is its
+# only reference (the amino acid literals are already interned by the compiler)
+RNA_CODON_TABLE: Mapping[str, str] = MappingProxyType(_RNA_CODON_TABLE)
+del _RNA_CODON_TABLE
+
+# Inverse mapping: amino acid -> codons that encode it
+_aa_to_codons: Dict[str, List[str]] = {}
+for _codon, _aa in RNA_CODON_TABLE.items():
+    _aa_to_codons.setdefault(_aa, []).append(_codon)
+AA_TO_CODONS: Dict[str, Tuple[str, ...]] = {
+    aa: tuple(codons) for aa, codons in _aa_to_codons.items()
+}
+del _aa_to_codons, _codon, _aa
+
 # Additional useful constants for bioinformatics applications
-START_CODONS: Set[str] = {"AUG"}
-STOP_CODONS: Set[str] = {"UAA", "UAG", "UGA"}
+START_CODONS: FrozenSet[str] = frozenset({"AUG"})
+STOP_CODONS: FrozenSet[str] = frozenset({"UAA", "UAG", "UGA"})
+
+# Two-bit codes for RNA bases; a codon packs into a 6-bit key (b0 << 4 | b1 << 2 | b2)
+RNA_BASE_CODES: Dict[str, int] = {"A": 0, "C": 1, "G": 2, "U": 3}
+
+# All 64 codons ordered by their 6-bit key
+CODONS_BY_KEY: Tuple[str, ...] = tuple(
+    b0 + b1 + b2 for b0 in "ACGU" for b1 in "ACGU" for b2 in "ACGU"
+)
+
+# Stop codons as a 64-bit bitmap over codon keys: (STOP_CODON_MASK >> key) & 1
+STOP_CODON_MASK: int = sum(1 << CODONS_BY_KEY.index(codon) for codon in STOP_CODONS)
+
+# Amino acids indexed by 6-bit codon key (flat alternative to RNA_CODON_TABLE)
+AA_TABLE_FLAT: Tuple[str, ...] = tuple(RNA_CODON_TABLE[codon] for codon in CODONS_BY_KEY)
 
 # Amino acid properties for advanced analysis
-AMINO_ACID_PROPERTIES: Dict[str, Dict[str, str]] = {
+_AMINO_ACID_PROPERTIES: Dict[str, Dict[str, str]] = {
     "Phe": {"name": "Phenylalanine", "type": "Aromatic", "charge": "Neutral"},
     "Leu": {"name": "Leucine", "type": "Aliphatic", "charge": "Neutral"},
     "Ile": {"name": "Isoleucine", "type": "Aliphatic", "charge": "Neutral"},
@@ -120,6 +149,15 @@ AMINO_ACID_PROPERTIES: Dict[str, Dict[str, str]] = {
     "Gly": {"name": "Glycine", "type": "Aliphatic", "charge": "Neutral"},
 }
 
+AMINO_ACID_PROPERTIES: Mapping[str, Mapping[str, str]] = MappingProxyType({
+    aa: MappingProxyType(props) for aa, props in _AMINO_ACID_PROPERTIES.items()
+})
+del _AMINO_ACID_PROPERTIES
+
+# Flat single-lookup views used by the getter functions below
+_AA_NAME: Dict[str, str] = {aa: props["name"] for aa, props in AMINO_ACID_PROPERTIES.items()}
+_AA_TYPE: Dict[str, str] = {aa: props["type"] for aa, props in AMINO_ACID_PROPERTIES.items()}
+
 
 def get_amino_acid_full_name(short_name: str) -> str:
     """
@@ -131,7 +169,7 @@ def get_amino_acid_full_name(short_name: str) -> str:
     Returns:
         str: Full amino acid name
     """
-    return AMINO_ACID_PROPERTIES.get(short_name, {}).get("name", "Unknown")
+    return _AA_NAME.get(short_name, "Unknown")
 
 
 def get_amino_acid_type(short_name: str) -> str:
@@ -144,7 +182,7 @@ def get_amino_acid_type(short_name: str) -> str:
     Returns:
         str: Chemical type of the amino acid
     """
-    return AMINO_ACID_PROPERTIES.get(short_name, {}).get("type", "Unknown")
+    return _AA_TYPE.get(short_name, "Unknown")
 
 
 def get_codons_for_amino_acid(amino_acid: str) -> List[str]:
@@ -157,7 +195,25 @@ def get_codons_for_amino_acid(amino_acid: str) -> List[str]:
     Returns:
         List[str]: List of codons that code for the amino acid
     """
-    return [codon for codon, aa in RNA_CODON_TABLE.items() if aa == amino_acid]
+    return list(AA_TO_CODONS.get(amino_acid, ()))
+
+
+def codon_to_key(codon: str) -> int:
+    """
+    Pack an RNA codon into its 6-bit integer key.
+    
+    Args:
+        codon (str): RNA codon sequence
+        
+    Returns:
+        int: Codon key in the range 0-63
+    """
+    codon = codon.upper()
+    return (
+        (RNA_BASE_CODES[codon[0]] << 4)
+        | (RNA_BASE_CODES[codon[1]] << 2)
+        | RNA_BASE_CODES[codon[2]]
+    )
 
 
 def is_start_codon(codon: str) -> bool:
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Fast Translation Kernels
+
+This module holds the inner codon-scanning loop used by DNAProcessor. Single
+sequences are always scanned in plain Python. The batch scanner JIT-compiles
+the loop with Numba when it is installed; Numba is only imported on the first
+batch call, so importing this module stays cheap.
+
+Author: Sukarth Acharya
+Date: 2025
+Project: LCOM.e
+"""
+
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import List, Sequence
+
+from Codon_Table import RNA_BASE_CODES, STOP_CODON_MASK
+
+NUMBA_AVAILABLE = find_spec('numba') is not None
+
+# Translation table from RNA bases to their 2-bit codes (as code points 0-3)
+_RNA_TO_CODES = str.maketrans({base: chr(code) for base, code in RNA_BASE_CODES.items()})
+_RNA_BASES = ''.join(RNA_BASE_CODES)
+
+
+def _check_rna_sequence(rna_sequence: str) -> None:
+    """
+    Reject sequences containing anything other than A, C, G and U.
+
+    The kernels pack 2-bit codes without bounds checks, so any other
+    character would silently produce a wrong codon key.
+
+    Raises:
+        ValueError: If the sequence contains an invalid base
+    """
+    if rna_sequence.lstrip(_RNA_BASES):
+        raise ValueError(f"Invalid RNA sequence {rna_sequence!r}: only A, C, G and U are allowed")
+
+
+def _scan_codons(codes, stop_mask, out):
+    """
+    Pack base codes into codon keys, skipping stop codons.
+
+    Args:
+        codes: Sequence of 2-bit base codes (bytes or uint8 array)
+        stop_mask (int): Bitmap of stop codon keys
+        out: Writable buffer with room for len(codes) // 3 keys
+
+    Returns:
+        int: Number of keys written to out
+    """
+    count = 0
+    for i in range(0, len(codes) - 2, 3):
+        key = (codes[i] << 4) | (codes[i + 1] << 2) | codes[i + 2]
+        if not (stop_mask >> key) & 1:
+            out[count] = key
+            count += 1
+    return count
+
+
+def _make_batch_kernel(scan):
+    """
+    Build a kernel that runs scan over many sequences stored back to back.
+
+    Taking scan as an argument lets the same loop run either as plain Python
+    or JIT-compiled around the compiled scan.
+    """
+    def scan_batch(codes, starts, out_starts, stop_mask, out, counts):
+        for i in range(len(counts)):
+            counts[i] = scan(
+                codes[starts[i]:starts[i + 1]], stop_mask, out[out_starts[i]:out_starts[i + 1]]
+            )
+    return scan_batch
+
+
+_scan_codons_batch = _make_batch_kernel(_scan_codons)
+
+
+@lru_cache(maxsize=None)
+def _load_numba_backend():
+    """
+    Import Numba and compile the batch kernel on first use.
+
+    Returns:
+        tuple: (numpy module, compiled batch kernel), or None without Numba
+    """
+    if not NUMBA_AVAILABLE:
+        return None
+    import numpy as np
+    from numba import njit
+    return np, njit(_make_batch_kernel(njit(cache=True)(_scan_codons)))
+
+
+def scan_codon_keys(rna_sequence: str) -> bytes:
+    """
+    Convert an RNA sequence to 6-bit codon keys with stop codons removed.
+
+    Args:
+        rna_sequence (str): RNA sequence (A, C, G, U)
+
+    Returns:
+        bytes: One codon key per byte
+
+    Raises:
+        ValueError: If the sequence contains an invalid base
+    """
+    _check_rna_sequence(rna_sequence)
+    codes = rna_sequence.translate(_RNA_TO_CODES).encode('ascii')
+    out = bytearray(len(codes) // 3)
+    count = _scan_codons(codes, STOP_CODON_MASK, out)
+    return bytes(out[:count])
+
+
+def scan_codon_keys_batch(rna_sequences: Sequence[str], validate: bool = True) -> List[bytes]:
+    """
+    Convert many RNA sequences to codon keys in one kernel call.
+
+    Args:
+        rna_sequences (Sequence[str]): RNA sequences (A, C, G, U)
+        validate (bool): Check every base first; pass False only when the
+            caller has already validated the sequences
+
+    Returns:
+        List[bytes]: Codon keys for each sequence, stop codons removed
+
+    Raises:
+        ValueError: If validate is set and any sequence contains an invalid base
+    """
+    starts = [0]
+    out_starts = [0]
+    for rna_sequence in rna_sequences:
+        if validate:
+            _check_rna_sequence(rna_sequence)
+        starts.append(starts[-1] + len(rna_sequence))
+        out_starts.append(out_starts[-1] + len(rna_sequence) // 3)
+
+    codes = ''.join(rna_sequences).translate(_RNA_TO_CODES).encode('ascii')
+    backend = _load_numba_backend()
+
+    if backend is not None:
+        np, scan_batch = backend
+        out = np.empty(out_starts[-1], dtype=np.uint8)
+        counts = np.zeros(len(rna_sequences), dtype=np.int64)
+        scan_batch(
+            np.frombuffer(codes, dtype=np.uint8), np.array(starts, dtype=np.int64),
+            np.array(out_starts, dtype=np.int64), STOP_CODON_MASK, out, counts,
+        )
+    else:
+        # Slices of a memoryview write through to the shared buffer
+        out = memoryview(bytearray(out_starts[-1]))
+        counts = [0] * len(rna_sequences)
+        _scan_codons_batch(codes, starts, out_starts, STOP_CODON_MASK, out, counts)
+
+    return [
+        bytes(out[out_starts[i]:out_starts[i] + counts[i]])
+        for i in range(len(rna_sequences))
+    ]
@@ -10,14 +10,57 @@ Date: 2025
 Project: LCOM.e
 """
 
-import random
 import sys
-from datetime import date
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import List, Optional, TextIO
 
 # Import the RNA codon table
-from Codon_Table import RNA_CODON_TABLE
+from Codon_Table import (
+    RNA_CODON_TABLE, STOP_CODONS, CODONS_BY_KEY, AA_TABLE_FLAT, codon_to_key
+)
+from fast_translate import scan_codon_keys, scan_codon_keys_batch
+
+# DNA to RNA transcription table (template strand: A->U, C->G, G->C, T->A).
+# Lowercase bases are folded in so transcription needs no separate upper() pass.
+_DNA_TO_RNA = str.maketrans('ACGTacgt', 'UGCAUGCA')
+
+# Maps every byte value to a base by its low two bits (uniform, since 256 % 4 == 0)
+_BYTE_TO_BASE = bytes(b'ACGT'[i & 3] for i in range(256))
+
+# Three-letter amino acid codes as bytes, indexed by codon key ('***' for stop codons)
+_AA_BYTES_BY_KEY = tuple(
+    b'***' if aa == "STOP" else aa.encode('ascii') for aa in AA_TABLE_FLAT
+)
+
+# Sequence constants shared by every DNAProcessor
+_VALID_BASES = frozenset('ACGT')
+_START_CODON = 'AUG'
+_START_CODON_KEY = codon_to_key(_START_CODON)
+
+# Codon -> amino acid, with stop codons mapped to '' so they test falsy
+_CODON_TO_AA = {
+    codon: ('' if aa == "STOP" else aa) for codon, aa in RNA_CODON_TABLE.items()
+}
+
+
+@lru_cache(maxsize=1024)
+def _normalize_dna_sequence(sequence: str) -> Optional[str]:
+    """
+    Check the bases of an uppercase DNA sequence (memoized; the check is pure).
+    
+    Only called with sequences that already passed the length checks, so the
+    cache holds at most 1024 strings of 30 characters or fewer.
+    
+    Args:
+        sequence (str): Uppercase DNA sequence of valid length
+        
+    Returns:
+        Optional[str]: The sequence if valid, None otherwise
+    """
+    # Check if all characters are valid DNA bases: stripping every leading
+    # A/C/G/T leaves an empty string only if no other character is present
+    return None if sequence.lstrip('ACGT') else sequence
 
 
 class DNAProcessor:
@@ -25,11 +68,27 @@ class DNAProcessor:
     A class to handle DNA sequence processing and protein translation.
     """
     
-    def __init__(self):
-        self.base_transcription = {'A': 'U', 'C': 'G', 'G': 'C', 'T': 'A'}
-        self.valid_bases = set('ACGT')
-        self.stop_codons = {'UAA', 'UAG', 'UGA'}
-        self.start_codon = 'AUG'
+    valid_bases = _VALID_BASES
+    stop_codons = STOP_CODONS
+    start_codon = _START_CODON
+    
+    def normalize_dna_sequence(self, sequence: str) -> Optional[str]:
+        """
+        Validate a DNA sequence and return it uppercased.
+        
+        Args:
+            sequence (str): DNA sequence to validate
+            
+        Returns:
+            Optional[str]: Uppercase sequence if valid, None otherwise
+        """
+        # Check length constraints (9-30, divisible by 3) before touching the
+        # cache, so oversized input is neither copied nor kept alive
+        if not (9 <= len(sequence) <= 30) or len(sequence) % 3 != 0:
+            return None
+        
+        # Uppercase first so 'acg...' and 'ACG...' share one cache entry
+        return _normalize_dna_sequence(sequence.upper())
     
     def validate_dna_sequence(self, sequence: str) -> bool:
         """
@@ -41,19 +100,7 @@ class DNAProcessor:
         Returns:
             bool: True if valid, False otherwise
         """
-        if not sequence:
-            return False
-        
-        # Check length constraints
-        if not (9 <= len(sequence) <= 30):
-            return False
-        
-        # Check if length is divisible by 3
-        if len(sequence) % 3 != 0:
-            return False
-        
-        # Check if all characters are valid DNA bases
-        return all(base in self.valid_bases for base in sequence.upper())
+        return self.normalize_dna_sequence(sequence) is not None
     
     def transcribe_dna_to_rna(self, dna_sequence: str) -> str:
         """
@@ -65,7 +112,7 @@ class DNAProcessor:
         Returns:
             str: RNA sequence
         """
-        return ''.join(self.base_transcription[base] for base in dna_sequence.upper())
+        return dna_sequence.translate(_DNA_TO_RNA)
     
     def convert_to_codons(self, rna_sequence: str) -> List[str]:
         """
@@ -77,12 +124,27 @@ class DNAProcessor:
         Returns:
             List[str]: List of codons with start codon added
         """
-        codons = [rna_sequence[i:i + 3] for i in range(0, len(rna_sequence), 3)]
-        codons.insert(0, self.start_codon)
+        codons = [self.start_codon]
+        codons.extend(rna_sequence[i:i + 3] for i in range(0, len(rna_sequence), 3))
         
         # Filter out stop codons
         return [codon for codon in codons if codon not in self.stop_codons]
     
+    def convert_to_codon_keys(self, rna_sequence: str) -> bytes:
+        """
+        Convert RNA sequence to 6-bit codon keys in a single pass.
+        
+        Equivalent to convert_to_codons, but each codon is packed into a
+        single byte instead of being sliced out as a string.
+        
+        Args:
+            rna_sequence (str): RNA sequence
+            
+        Returns:
+            bytes: Codon keys with start codon added and stop codons removed
+        """
+        return bytes((_START_CODON_KEY,)) + scan_codon_keys(rna_sequence)
+    
     def translate_codons_to_amino_acids(self, codons: List[str]) -> List[str]:
         """
         Translate codons to amino acids.
@@ -93,10 +155,74 @@ class DNAProcessor:
         Returns:
             List[str]: List of amino acids
         """
-        amino_acids = [RNA_CODON_TABLE.get(codon, "Unknown") for codon in codons]
+        # Single pass: stop codons map to '' and unknown codons to None, so a
+        # truthiness check drops both without a set lookup
+        lookup = _CODON_TO_AA.get
+        return [aa for aa in map(lookup, codons) if aa]
+    
+    def translate_codon_keys(self, codon_keys: bytes) -> List[str]:
+        """
+        Translate 6-bit codon keys to amino acids.
         
-        # Filter out unknown and stop codons
-        return [aa for aa in amino_acids if aa not in {"Unknown", "STOP"}]
+        Stop codons are already removed by convert_to_codon_keys, so no
+        filtering is done here.
+        
+        Args:
+            codon_keys (bytes): Codon keys from convert_to_codon_keys
+            
+        Returns:
+            List[str]: List of amino acids
+        """
+        return [AA_TABLE_FLAT[key] for key in codon_keys]
+    
+    def translate_many(self, dna_sequences: List[str]) -> List[List[str]]:
+        """
+        Translate many DNA sequences to amino acids in one batch.
+        
+        Codon scanning for the whole batch runs in a single fast_translate
+        kernel call (JIT-compiled when Numba is installed).
+        
+        Args:
+            dna_sequences (List[str]): DNA sequences
+            
+        Returns:
+            List[List[str]]: Amino acids for each sequence
+            
+        Raises:
+            ValueError: If a sequence contains characters other than A, C, G, T
+        """
+        for sequence in dna_sequences:
+            if sequence.upper().lstrip('ACGT'):
+                raise ValueError(
+                    f"Invalid DNA sequence {sequence!r}: only A, C, G and T are allowed"
+                )
+        
+        # Valid DNA always transcribes to valid RNA, so the scanner need not recheck it
+        rna_sequences = [self.transcribe_dna_to_rna(sequence) for sequence in dna_sequences]
+        start = [AA_TABLE_FLAT[_START_CODON_KEY]]
+        return [
+            start + self.translate_codon_keys(codon_keys)
+            for codon_keys in scan_codon_keys_batch(rna_sequences, validate=False)
+        ]
+    
+    def build_protein_chain(self, codon_keys: bytes) -> str:
+        """
+        Build the hyphen-joined protein chain directly from codon keys.
+        
+        Writes amino acid codes into a preallocated buffer instead of
+        materializing a list of amino acid strings and joining it.
+        
+        Args:
+            codon_keys (bytes): Codon keys from convert_to_codon_keys
+            
+        Returns:
+            str: Protein chain (e.g. Met-Ser-Gly)
+        """
+        buffer = bytearray(b'-' * (4 * len(codon_keys) - 1))
+        for position, key in enumerate(codon_keys):
+            start = 4 * position
+            buffer[start:start + 3] = _AA_BYTES_BY_KEY[key]
+        return buffer.decode('ascii')
     
     def generate_random_sequence(self, length: int) -> str:
         """
@@ -108,7 +234,15 @@ class DNAProcessor:
         Returns:
             str: Random DNA sequence
         """
-        return ''.join(random.choice('ACGT') for _ in range(length))
+        # Imported here so the CUSTOM input path never loads the random module
+        import random
+        
+        if length <= 0:
+            return ''
+        
+        # One bulk RNG call, then a C-level byte translation to bases
+        raw = random.getrandbits(8 * length).to_bytes(length, 'little')
+        return raw.translate(_BYTE_TO_BASE).decode('ascii')
 
 
 class ReportGenerator:
@@ -116,48 +250,88 @@ class ReportGenerator:
     A class to handle report generation and file operations.
     """
     
+    # Constant report text, assembled once when the class is defined
+    _HEADER_TITLE = "=" * 50 + "\nDNA TO PROTEIN TRANSLATION REPORT\n" + "=" * 50 + "\n\n"
+    _HEADER_FOOTER = "Tool version: 2.0\n\n" + "-" * 50 + "\n\n"
+    _FINAL_NOTES = "".join([
+        "-" * 50 + "\n",
+        "IMPORTANT NOTES:\n",
+        "• This is an educational tool for learning purposes\n",
+        "• Results are simplified and not suitable for real research\n",
+        "• Does not account for reading frames or regulatory sequences\n\n",
+        "-" * 50 + "\n",
+        "Original concept by: Utsav Choudhury (2025)\n",
+        "Enhanced by: Sukarth Acharya (2025)\n",
+        "Project: LCOM.e\n",
+    ])
+    
     def __init__(self, filename: str):
         self.filename = filename
         self.filepath = Path(f"{filename}.txt")
+        self._buffer: List[str] = []
+    
+    def __enter__(self) -> 'ReportGenerator':
+        """
+        Start a new report; it is saved when the with-block exits cleanly.
+        """
+        self.initialize_report()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        """
+        Save the report unless the with-block raised.
+        """
+        if exc_type is None:
+            self.save()
+        return False
     
     def initialize_report(self) -> None:
         """
-        Create and initialize a new report file with header.
+        Start a new report with header.
+        
+        Report content is buffered in memory until save() is called.
         """
-        with open(self.filepath, 'w', encoding='utf-8') as file:
-            file.write("=" * 50 + "\n")
-            file.write("DNA TO PROTEIN TRANSLATION REPORT\n")
-            file.write("=" * 50 + "\n\n")
-            file.write(f"Generated on: {date.today()}\n")
-            file.write(f"Tool version: 2.0\n\n")
-            file.write("-" * 50 + "\n\n")
+        from datetime import date
+        
+        self._buffer = [
+            self._HEADER_TITLE,
+            f"Generated on: {date.today()}\n",
+            self._HEADER_FOOTER,
+        ]
     
     def write_section(self, title: str, content: str) -> None:
         """
-        Write a section to the report file.
+        Write a section to the report.
         
         Args:
             title (str): Section title
             content (str): Section content
         """
-        with open(self.filepath, 'a', encoding='utf-8') as file:
-            file.write(f"{title.upper()}:\n")
-            file.write(f"{content}\n\n")
+        self._buffer.append(f"{title.upper()}:\n{content}\n\n")
     
     def write_final_notes(self) -> None:
         """
         Add final notes and disclaimer to the report.
         """
-        with open(self.filepath, 'a', encoding='utf-8') as file:
-            file.write("-" * 50 + "\n")
-            file.write("IMPORTANT NOTES:\n")
-            file.write("• This is an educational tool for learning purposes\n")
-            file.write("• Results are simplified and not suitable for real research\n")
-            file.write("• Does not account for reading frames or regulatory sequences\n\n")
-            file.write("-" * 50 + "\n")
-            file.write("Original concept by: Utsav Choudhury (2025)\n")
-            file.write("Enhanced by: Sukarth Acharya (2025)\n")
-            file.write("Project: LCOM.e\n")
+        self._buffer.append(self._FINAL_NOTES)
+    
+    def write_to(self, file: TextIO) -> None:
+        """
+        Write the buffered report to an already open text file.
+        
+        The report is joined first so it is encoded and written in one call.
+        
+        Args:
+            file (TextIO): Writable text stream
+        """
+        file.write(''.join(self._buffer))
+    
+    def save(self) -> None:
+        """
+        Write the buffered report to the report file through a single handle.
+        """
+        with open(self.filepath, 'w', encoding='utf-8') as file:
+            self.write_to(file)
 
 
 class UserInterface:
@@ -219,20 +393,22 @@ class UserInterface:
         print("• Only use A, C, G, T characters")
         
         while True:
-            sequence = input("\nEnter your DNA sequence: ").strip().upper()
+            sequence = input("\nEnter your DNA sequence: ").strip()
+            normalized = self.dna_processor.normalize_dna_sequence(sequence)
             
-            if self.dna_processor.validate_dna_sequence(sequence):
-                return sequence
+            if normalized is not None:
+                return normalized
             else:
                 print("❌ Invalid sequence. Please check the requirements and try again.")
                 
                 # Provide specific feedback
+                sequence = sequence.upper()
                 if len(sequence) < 9 or len(sequence) > 30:
                     print(f"   Length is {len(sequence)}, must be between 9-30.")
                 elif len(sequence) % 3 != 0:
                     print(f"   Length {len(sequence)} is not divisible by 3.")
-                elif not all(base in 'ACGT' for base in sequence):
-                    invalid_chars = set(sequence) - set('ACGT')
+                elif not self.dna_processor.valid_bases.issuperset(sequence):
+                    invalid_chars = set(sequence) - self.dna_processor.valid_bases
                     print(f"   Invalid characters found: {', '.join(invalid_chars)}")
     
     def get_random_sequence_length(self) -> int:
@@ -262,9 +438,11 @@ def main() -> None:
     """
     Main function to run the DNA to Protein translation tool.
     """
-    print("🧬 DNA to Protein Translation Tool")
-    print("=" * 40)
-    print("Welcome! This tool converts DNA sequences to protein chains.")
+    sys.stdout.write(
+        "🧬 DNA to Protein Translation Tool\n"
+        + "=" * 40 + "\n"
+        + "Welcome! This tool converts DNA sequences to protein chains.\n"
+    )
     
     try:
         # Initialize components
@@ -291,33 +469,39 @@ def main() -> None:
         # Transcription: DNA to RNA
         rna_sequence = dna_processor.transcribe_dna_to_rna(dna_sequence)
         
-        # Convert to codons
-        codons = dna_processor.convert_to_codons(rna_sequence)
+        # Convert to codon keys
+        codon_keys = dna_processor.convert_to_codon_keys(rna_sequence)
         
         # Translation: codons to amino acids
-        amino_acids = dna_processor.translate_codons_to_amino_acids(codons)
+        amino_acids = dna_processor.translate_codon_keys(codon_keys)
+        
+        # Codon strings are only needed for the report
+        codons = [CODONS_BY_KEY[key] for key in codon_keys]
         
         # Create final protein chain
-        protein_chain = '-'.join(amino_acids)
+        protein_chain = dna_processor.build_protein_chain(codon_keys)
         
         # Generate report
         print("\n📝 Generating report...")
-        report_generator.initialize_report()
-        report_generator.write_section("Sequence Source", sequence_source)
-        report_generator.write_section("Original DNA Sequence", dna_sequence)
-        report_generator.write_section("Transcribed RNA Sequence", rna_sequence)
-        report_generator.write_section("Codons (with start codon)", str(codons))
-        report_generator.write_section("Amino Acids", str(amino_acids))
-        report_generator.write_section("Final Protein Chain", protein_chain)
-        report_generator.write_final_notes()
-        
-        # Display results
-        print("\n✅ Process completed successfully!")
-        print(f"\n📊 Results Summary:")
-        print(f"   DNA Sequence: {dna_sequence}")
-        print(f"   RNA Sequence: {rna_sequence}")
-        print(f"   Protein Chain: {protein_chain}")
-        print(f"   Report saved as: {filename}.txt")
+        with report_generator:
+            report_generator.write_section("Sequence Source", sequence_source)
+            report_generator.write_section("Original DNA Sequence", dna_sequence)
+            report_generator.write_section("Transcribed RNA Sequence", rna_sequence)
+            report_generator.write_section("Codons (with start codon)", str(codons))
+            report_generator.write_section("Amino Acids", str(amino_acids))
+            report_generator.write_section("Final Protein Chain", protein_chain)
+            report_generator.write_final_notes()
+        
+        # Display results in a single write
+        summary = [
+            "\n✅ Process completed successfully!",
+            "\n📊 Results Summary:",
+            f"   DNA Sequence: {dna_sequence}",
+            f"   RNA Sequence: {rna_sequence}",
+            f"   Protein Chain: {protein_chain}",
+            f"   Report saved as: {filename}.txt",
+        ]
+        sys.stdout.write('\n'.join(summary) + '\n')
         
     except KeyboardInterrupt:
         print("\n\n⚠️ Process interrupted by user.")
@@ -11,13 +11,19 @@ Project: LCOM.e
 """
 
 import unittest
+import io
 import tempfile
-import os
+import sys
 from pathlib import Path
+import random
 from main import DNAProcessor, ReportGenerator
+from fast_translate import (
+    NUMBA_AVAILABLE, scan_codon_keys, scan_codon_keys_batch
+)
 from Codon_Table import (
-    RNA_CODON_TABLE, get_amino_acid_full_name, get_amino_acid_type,
-    get_codons_for_amino_acid, is_start_codon, is_stop_codon
+    RNA_CODON_TABLE, AMINO_ACID_PROPERTIES, get_amino_acid_full_name, get_amino_acid_type,
+    get_codons_for_amino_acid, is_start_codon, is_stop_codon,
+    CODONS_BY_KEY, AA_TABLE_FLAT, STOP_CODON_MASK, codon_to_key
 )
 
 
@@ -59,6 +65,12 @@ class TestDNAProcessor(unittest.TestCase):
             with self.subTest(sequence=seq):
                 self.assertFalse(self.processor.validate_dna_sequence(seq))
     
+    def test_normalize_dna_sequence(self):
+        """Test normalization uppercases valid sequences and rejects invalid ones."""
+        self.assertEqual(self.processor.normalize_dna_sequence("atcgATCGa"), "ATCGATCGA")
+        self.assertIsNone(self.processor.normalize_dna_sequence("ATCGATCGX"))
+        self.assertIsNone(self.processor.normalize_dna_sequence("ATCG"))
+    
     def test_transcribe_dna_to_rna(self):
         """Test DNA to RNA transcription."""
         test_cases = [
@@ -86,6 +98,14 @@ class TestDNAProcessor(unittest.TestCase):
                 result = self.processor.convert_to_codons(rna)
                 self.assertEqual(result, expected)
     
+    def test_convert_to_codon_keys(self):
+        """Test RNA to codon key conversion matches the string codons."""
+        for rna in ["AUCGAU", "AUCGAUUAA", "GGGUAG", "UAAUGAUAG"]:
+            with self.subTest(rna=rna):
+                keys = self.processor.convert_to_codon_keys(rna)
+                codons = self.processor.convert_to_codons(rna)
+                self.assertEqual(keys, bytes(codon_to_key(codon) for codon in codons))
+    
     def test_translate_codons_to_amino_acids(self):
         """Test codon to amino acid translation."""
         test_codons = ["AUG", "UUU", "CCC", "UAA"]  # Met, Phe, Pro, STOP
@@ -94,6 +114,49 @@ class TestDNAProcessor(unittest.TestCase):
         result = self.processor.translate_codons_to_amino_acids(test_codons)
         self.assertEqual(result, expected_aa)
     
+    def test_translate_codon_keys(self):
+        """Test codon key translation matches string codon translation."""
+        keys = self.processor.convert_to_codon_keys("UUUCCCUAA")  # Phe, Pro, STOP
+        
+        result = self.processor.translate_codon_keys(keys)
+        self.assertEqual(result, ["Met", "Phe", "Pro"])
+    
+    def test_key_pipeline_matches_string_pipeline(self):
+        """Test translating codon keys matches translating codon strings."""
+        for rna in ["AUCGAU", "AUCGAUUAA", "GGGUAG", "UAAUGAUAG"]:
+            with self.subTest(rna=rna):
+                codons = self.processor.convert_to_codons(rna)
+                expected = self.processor.translate_codons_to_amino_acids(codons)
+                keys = self.processor.convert_to_codon_keys(rna)
+                self.assertEqual(self.processor.translate_codon_keys(keys), expected)
+    
+    def test_translate_many(self):
+        """Test batch translation matches the single-sequence pipeline."""
+        sequences = ["ATGTTCCCG", "ATGTTCATT", "atcgatcga", "GGCAAGTTCATT"]
+        expected = []
+        for seq in sequences:
+            codons = self.processor.convert_to_codons(self.processor.transcribe_dna_to_rna(seq))
+            expected.append(self.processor.translate_codons_to_amino_acids(codons))
+        
+        self.assertEqual(self.processor.translate_many(sequences), expected)
+    
+    def test_translate_many_rejects_invalid_sequence(self):
+        """Test batch translation raises ValueError naming the bad sequence."""
+        for bad in ["ATGNNN", "AAN", "ATG€", "AUG"]:
+            with self.subTest(sequence=bad):
+                with self.assertRaisesRegex(ValueError, repr(bad)):
+                    self.processor.translate_many(["ATGTTCCCG", bad])
+    
+    def test_build_protein_chain(self):
+        """Test building the protein chain from codon keys."""
+        for rna in ["AUCGAU", "AUCGAUUAA", "UAAUGAUAG", ""]:
+            with self.subTest(rna=rna):
+                keys = self.processor.convert_to_codon_keys(rna)
+                expected = '-'.join(self.processor.translate_codon_keys(keys))
+                self.assertEqual(self.processor.build_protein_chain(keys), expected)
+        
+        self.assertEqual(self.processor.build_protein_chain(b''), '')
+    
     def test_generate_random_sequence(self):
         """Test random sequence generation."""
         lengths = [9, 12, 15, 18, 21, 24, 27, 30]
@@ -110,6 +173,21 @@ class TestDNAProcessor(unittest.TestCase):
                 
                 # Check sequence is valid
                 self.assertTrue(self.processor.validate_dna_sequence(sequence))
+    
+    def test_generate_random_sequence_seeded(self):
+        """Test random generation is reproducible with random.seed."""
+        self.addCleanup(random.setstate, random.getstate())
+        
+        random.seed(42)
+        first = self.processor.generate_random_sequence(30)
+        random.seed(42)
+        second = self.processor.generate_random_sequence(30)
+        
+        self.assertEqual(first, second)
+    
+    def test_generate_random_sequence_empty(self):
+        """Test a zero-length random sequence is empty."""
+        self.assertEqual(self.processor.generate_random_sequence(0), '')
 
 
 class TestCodonTable(unittest.TestCase):
@@ -136,6 +214,20 @@ class TestCodonTable(unittest.TestCase):
             with self.subTest(codon=codon, amino_acid=expected_aa):
                 self.assertEqual(RNA_CODON_TABLE[codon], expected_aa)
     
+    def test_stop_codon_mask(self):
+        """Test the stop codon bitmap flags exactly the stop codons."""
+        for key, codon in enumerate(CODONS_BY_KEY):
+            with self.subTest(codon=codon):
+                self.assertEqual(bool((STOP_CODON_MASK >> key) & 1), is_stop_codon(codon))
+    
+    def test_codon_table_is_read_only(self):
+        """Test that the shared codon tables cannot be modified."""
+        with self.assertRaises(TypeError):
+            RNA_CODON_TABLE["AUG"] = "Phe"
+        
+        with self.assertRaises(TypeError):
+            AMINO_ACID_PROPERTIES["Met"]["name"] = "Unknown"
+    
     def test_get_amino_acid_full_name(self):
         """Test getting full amino acid names."""
         test_cases = [
@@ -184,6 +276,25 @@ class TestCodonTable(unittest.TestCase):
                 for codon in codons:
                     self.assertEqual(RNA_CODON_TABLE[codon], aa)
     
+    def test_codon_to_key(self):
+        """Test 6-bit codon keys round-trip through CODONS_BY_KEY."""
+        self.assertEqual(len(CODONS_BY_KEY), 64)
+        self.assertEqual(set(CODONS_BY_KEY), set(RNA_CODON_TABLE))
+        
+        for key, codon in enumerate(CODONS_BY_KEY):
+            with self.subTest(codon=codon):
+                self.assertEqual(codon_to_key(codon), key)
+        
+        self.assertEqual(codon_to_key("aug"), codon_to_key("AUG"))
+    
+    def test_aa_table_flat(self):
+        """Test the flat amino acid table agrees with RNA_CODON_TABLE."""
+        self.assertEqual(len(AA_TABLE_FLAT), 64)
+        
+        for codon, amino_acid in RNA_CODON_TABLE.items():
+            with self.subTest(codon=codon):
+                self.assertEqual(AA_TABLE_FLAT[codon_to_key(codon)], amino_acid)
+    
     def test_is_start_codon(self):
         """Test start codon identification."""
         self.assertTrue(is_start_codon("AUG"))
@@ -207,6 +318,45 @@ class TestCodonTable(unittest.TestCase):
                 self.assertFalse(is_stop_codon(codon))
 
 
+class TestFastTranslate(unittest.TestCase):
+    """
+    Test cases for the fast_translate kernels.
+    """
+    
+    def test_scan_codon_keys_matches_python(self):
+        """Test the scan kernel agrees with string codon splitting on random input."""
+        rng = random.Random(0)
+        
+        for _ in range(200):
+            rna = ''.join(rng.choice('ACGU') for _ in range(3 * rng.randint(0, 40)))
+            expected = bytes(
+                codon_to_key(rna[i:i + 3]) for i in range(0, len(rna), 3)
+                if not is_stop_codon(rna[i:i + 3])
+            )
+            with self.subTest(rna=rna, numba=NUMBA_AVAILABLE):
+                self.assertEqual(scan_codon_keys(rna), expected)
+    
+    def test_scan_codon_keys_batch(self):
+        """Test batch scanning matches scanning each sequence on its own."""
+        rng = random.Random(2)
+        batch = [
+            ''.join(rng.choice('ACGU') for _ in range(rng.randint(0, 40)))
+            for _ in range(100)
+        ]
+        
+        self.assertEqual(scan_codon_keys_batch(batch), [scan_codon_keys(rna) for rna in batch])
+        self.assertEqual(scan_codon_keys_batch([]), [])
+
+    def test_scan_rejects_invalid_bases(self):
+        """Test both scanners raise ValueError for non-ACGU input."""
+        for rna in ['AUGNNN', 'AUGT', 'aug', 'AUG€']:
+            with self.subTest(rna=rna):
+                with self.assertRaises(ValueError):
+                    scan_codon_keys(rna)
+                with self.assertRaises(ValueError):
+                    scan_codon_keys_batch(['AUG', rna])
+
+
 class TestReportGenerator(unittest.TestCase):
     """
     Test cases for the ReportGenerator class.
@@ -214,25 +364,19 @@ class TestReportGenerator(unittest.TestCase):
     
     def setUp(self):
         """Set up test fixtures before each test method."""
-        self.temp_dir = tempfile.mkdtemp()
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        
         self.test_filename = "test_report"
         self.report_gen = ReportGenerator(self.test_filename)
         
         # Override filepath to use temp directory
-        self.report_gen.filepath = Path(self.temp_dir) / f"{self.test_filename}.txt"
-    
-    def tearDown(self):
-        """Clean up after each test method."""
-        # Remove test file if it exists
-        if self.report_gen.filepath.exists():
-            self.report_gen.filepath.unlink()
-        
-        # Remove temp directory
-        os.rmdir(self.temp_dir)
+        self.report_gen.filepath = Path(temp_dir.name) / f"{self.test_filename}.txt"
     
     def test_initialize_report(self):
         """Test report initialization."""
         self.report_gen.initialize_report()
+        self.report_gen.save()
         
         # Check file was created
         self.assertTrue(self.report_gen.filepath.exists())
@@ -251,8 +395,10 @@ class TestReportGenerator(unittest.TestCase):
         test_content = "This is test content"
         
         self.report_gen.write_section(test_title, test_content)
+        stream = io.StringIO()
+        self.report_gen.write_to(stream)
         
-        content = self.report_gen.filepath.read_text(encoding='utf-8')
+        content = stream.getvalue()
         self.assertIn(test_title.upper() + ":", content)
         self.assertIn(test_content, content)
     
@@ -260,12 +406,53 @@ class TestReportGenerator(unittest.TestCase):
         """Test writing final notes to report."""
         self.report_gen.initialize_report()
         self.report_gen.write_final_notes()
+        stream = io.StringIO()
+        self.report_gen.write_to(stream)
         
-        content = self.report_gen.filepath.read_text(encoding='utf-8')
+        content = stream.getvalue()
         self.assertIn("IMPORTANT NOTES:", content)
         self.assertIn("educational tool", content)
         self.assertIn("Utsav Choudhury", content)
         self.assertIn("Sukarth Acharya", content)
+    
+    def test_write_to_open_file(self):
+        """Test writing the report to an already open stream."""
+        self.report_gen.initialize_report()
+        self.report_gen.write_section("Test Section", "content")
+        
+        stream = io.StringIO()
+        self.report_gen.write_to(stream)
+        
+        self.assertIn("DNA TO PROTEIN TRANSLATION REPORT", stream.getvalue())
+        self.assertIn("TEST SECTION:\ncontent", stream.getvalue())
+        self.assertFalse(self.report_gen.filepath.exists())
+    
+    def test_context_manager_saves_on_exit(self):
+        """Test the report is written when the with-block exits."""
+        with self.report_gen as report:
+            report.write_section("Test Section", "content")
+            self.assertFalse(self.report_gen.filepath.exists())
+        
+        content = self.report_gen.filepath.read_text(encoding='utf-8')
+        self.assertIn("DNA TO PROTEIN TRANSLATION REPORT", content)
+        self.assertIn("TEST SECTION:", content)
+    
+    def test_context_manager_skips_save_on_error(self):
+        """Test no report is written if the with-block raises."""
+        with self.assertRaises(ValueError):
+            with self.report_gen:
+                raise ValueError("processing failed")
+        
+        self.assertFalse(self.report_gen.filepath.exists())
+    
+    def test_nothing_written_before_save(self):
+        """Test the report is buffered until save() is called."""
+        self.report_gen.initialize_report()
+        self.report_gen.write_section("Test Section", "content")
+        self.assertFalse(self.report_gen.filepath.exists())
+        
+        self.report_gen.save()
+        self.assertTrue(self.report_gen.filepath.exists())
 
 
 class TestIntegration(unittest.TestCase):
@@ -327,20 +514,9 @@ def run_tests():
     print("🧪 Running DNA Translation Tool Test Suite")
     print("=" * 50)
     
-    # Create test suite
-    test_suite = unittest.TestSuite()
-    
-    # Add test classes
-    test_classes = [
-        TestDNAProcessor,
-        TestCodonTable,
-        TestReportGenerator,
-        TestIntegration,
-    ]
-    
-    for test_class in test_classes:
-        tests = unittest.TestLoader().loadTestsFromTestCase(test_class)
-        test_suite.addTests(tests)
+    # Load every TestCase in this module with a single loader
+    loader = unittest.TestLoader()
+    test_suite = loader.loadTestsFromModule(sys.modules[__name__])
     
     # Run tests
     runner = unittest.TextTestRunner(verbosity=2)